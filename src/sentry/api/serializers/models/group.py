@@ -96,7 +96,9 @@ class GroupSerializer(Serializer):
 
         GroupMeta.objects.populate_cache(item_list)
 
-        attach_foreignkey(item_list, Group.project)
+        # ``Group.organization`` is read through the project when building
+        # the permalink, so join it in with the projects.
+        attach_foreignkey(item_list, Group.project, ['organization'])
 
         if user.is_authenticated() and item_list:
             bookmarks = set(GroupBookmark.objects.filter(
@@ -140,15 +142,26 @@ class GroupSerializer(Serializer):
             ).values_list('group', 'release')
         )
 
+        # Resolve the enabled plugins once per project rather than once per
+        # group, as most groups in a list share the same project.
+        project_plugins = {}
+        for item in item_list:
+            if item.project_id not in project_plugins:
+                project_plugins[item.project_id] = (
+                    list(plugins.for_project(project=item.project, version=1)),
+                    list(plugins.for_project(project=item.project, version=2)),
+                )
+
         result = {}
         for item in item_list:
             active_date = item.active_at or item.last_seen
 
+            v1_plugins, v2_plugins = project_plugins[item.project_id]
             annotations = []
-            for plugin in plugins.for_project(project=item.project, version=1):
+            for plugin in v1_plugins:
                 safe_execute(plugin.tags, None, item, annotations,
                              _with_transaction=False)
-            for plugin in plugins.for_project(project=item.project, version=2):
+            for plugin in v2_plugins:
                 annotations.extend(safe_execute(plugin.get_annotations, group=item,
                                                 _with_transaction=False) or ())
 
@@ -16,6 +16,7 @@ from jsonfield import JSONField
 from sentry.db.models import (
     BoundedPositiveIntegerField, FlexibleForeignKey, Model, sane_repr
 )
+from sentry.db.models.manager import BaseManager
 from sentry.utils.cache import cache
 from sentry.utils.hashlib import md5_text
 
@@ -34,6 +35,25 @@ class ReleaseProject(Model):
         unique_together = (('project', 'release'),)
 
 
+class ReleaseManager(BaseManager):
+    def create_with_project(self, project, version, **kwargs):
+        """
+        Create a release and associate it with ``project`` in a single
+        transaction.
+        """
+        kwargs.setdefault('organization_id', project.organization_id)
+        with transaction.atomic():
+            release = self.create(
+                project=project,
+                version=version,
+                **kwargs
+            )
+            ReleaseProject.objects.bulk_create([
+                ReleaseProject(project=project, release=release),
+            ])
+        return release
+
+
 class Release(Model):
     """
     A release is generally created when a new version is pushed into a
@@ -58,6 +78,8 @@ class Release(Model):
     # generally the release manager, or the person initiating the process
     owner = FlexibleForeignKey('sentry.User', null=True, blank=True)
 
+    objects = ReleaseManager()
+
     class Meta:
         app_label = 'sentry'
         db_table = 'sentry_release'
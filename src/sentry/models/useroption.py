@@ -7,10 +7,14 @@ sentry.models.useroption
 """
 from __future__ import absolute_import, print_function
 
+import operator
+
 from celery.signals import task_postrun
 from django.core.signals import request_finished
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
+from six.moves import reduce
 
 from sentry.db.models import FlexibleForeignKey, Model, sane_repr
 from sentry.db.models.fields import UnicodePickledObjectField
@@ -38,18 +42,18 @@ class UserOptionManager(BaseManager):
         self.__dict__.update(state)
         self.__metadata = {}
 
+    def _get_metakey(self, user, project):
+        if project:
+            return (user.pk, project.pk)
+        return (user.pk, None)
+
     def get_value(self, user, project, key, default=None):
         result = self.get_all_values(user, project)
         return result.get(key, default)
 
     def unset_value(self, user, project, key):
         self.filter(user=user, project=project, key=key).delete()
-        if not hasattr(self, '_metadata'):
-            return
-        if project:
-            metakey = (user.pk, project.pk)
-        else:
-            metakey = (user.pk, None)
+        metakey = self._get_metakey(user, project)
         if metakey not in self.__metadata:
             return
         self.__metadata[metakey].pop(key, None)
@@ -66,19 +70,37 @@ class UserOptionManager(BaseManager):
         if not created and inst.value != value:
             inst.update(value=value)
 
-        if project:
-            metakey = (user.pk, project.pk)
-        else:
-            metakey = (user.pk, None)
+        metakey = self._get_metakey(user, project)
         if metakey not in self.__metadata:
             return
         self.__metadata[metakey][key] = value
 
+    def apply_values(self, user, values):
+        """
+        Set or unset several options for ``user`` at once.
+
+        ``values`` is a list of ``(project, key, value)`` tuples, where a
+        ``value`` of ``None`` unsets the option. All unset options are removed
+        with a single query.
+        """
+        unset = [(project, key) for project, key, value in values if value is None]
+        if unset:
+            self.filter(reduce(operator.or_, (
+                Q(project=project, key=key) if project else
+                Q(project__isnull=True, key=key)
+                for project, key in unset
+            )), user=user).delete()
+            for project, key in unset:
+                metakey = self._get_metakey(user, project)
+                if metakey in self.__metadata:
+                    self.__metadata[metakey].pop(key, None)
+
+        for project, key, value in values:
+            if value is not None:
+                self.set_value(user, project, key, value)
+
     def get_all_values(self, user, project):
-        if project:
-            metakey = (user.pk, project.pk)
-        else:
-            metakey = (user.pk, None)
+        metakey = self._get_metakey(user, project)
         if metakey not in self.__metadata:
             result = dict(
                 (i.key, i.value) for i in
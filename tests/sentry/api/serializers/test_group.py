@@ -3,20 +3,59 @@
 from __future__ import absolute_import
 
 from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from mock import patch
 
 from sentry.api.serializers import serialize
+from sentry.api.serializers.models.group import GroupSerializer
 from sentry.models import (
-    GroupResolution, GroupResolutionStatus, GroupSnooze, GroupSubscription,
+    Group, GroupResolution, GroupResolutionStatus, GroupSnooze, GroupSubscription,
     GroupStatus, Release, UserOption, UserOptionValue
 )
 from sentry.testutils import TestCase
 
 
+def _now_s():
+    return timezone.now().replace(microsecond=0)
+
+
+_ALL = UserOptionValue.all_conversations
+_PART = UserOptionValue.participating_only
+
+_IMPLICIT_SUBSCRIBED_CASES = (
+    ((None, None), True),
+    ((_ALL, None), True),
+    ((_ALL, _ALL), True),
+    ((_ALL, _PART), False),
+    ((_PART, None), False),
+    ((_PART, _ALL), True),
+    ((_PART, _PART), False),
+)
+
+
 class GroupSerializerTest(TestCase):
+    def assert_serialize_query_count_is_constant(self, groups, user):
+        """
+        Assert that serializing all of ``groups`` issues no more queries than
+        serializing just the first one, i.e. that nothing is looked up per
+        group.
+        """
+        group_ids = [g.id for g in groups]
+
+        def fetch_and_serialize(ids):
+            items = list(Group.objects.filter(id__in=ids))
+            with CaptureQueriesContext(connection) as queries:
+                serialize(items, user)
+            return len(queries.captured_queries)
+
+        # warm up the option caches so they don't skew the counts below
+        fetch_and_serialize(group_ids)
+
+        assert fetch_and_serialize(group_ids) == fetch_and_serialize(group_ids[:1])
+
     def test_is_ignored_with_expired_snooze(self):
-        now = timezone.now().replace(microsecond=0)
+        now = _now_s()
 
         user = self.create_user()
         group = self.create_group(
@@ -32,7 +71,7 @@ class GroupSerializerTest(TestCase):
         assert result['statusDetails'] == {}
 
     def test_is_ignored_with_valid_snooze(self):
-        now = timezone.now().replace(microsecond=0)
+        now = _now_s()
 
         user = self.create_user()
         group = self.create_group(
@@ -48,12 +87,10 @@ class GroupSerializerTest(TestCase):
         assert result['statusDetails'] == {'ignoreUntil': snooze.until}
 
     def test_resolved_in_next_release(self):
-        release = Release.objects.create(
+        release = Release.objects.create_with_project(
             project=self.project,
-            organization_id=self.project.organization_id,
             version='a',
         )
-        release.add_project(self.project)
         user = self.create_user()
         group = self.create_group(
             status=GroupStatus.RESOLVED,
@@ -68,12 +105,10 @@ class GroupSerializerTest(TestCase):
         assert result['statusDetails'] == {'inNextRelease': True}
 
     def test_resolved_in_next_release_expired_resolution(self):
-        release = Release.objects.create(
+        release = Release.objects.create_with_project(
             project=self.project,
-            organization_id=self.project.organization_id,
             version='a',
         )
-        release.add_project(self.project)
         user = self.create_user()
         group = self.create_group(
             status=GroupStatus.RESOLVED,
@@ -88,9 +123,12 @@ class GroupSerializerTest(TestCase):
         assert result['status'] == 'resolved'
         assert result['statusDetails'] == {}
 
-    @patch('sentry.models.Group.is_over_resolve_age')
-    def test_auto_resolved(self, mock_is_over_resolve_age):
-        mock_is_over_resolve_age.return_value = True
+    def test_auto_resolved(self):
+        self.addCleanup(
+            setattr, Group, 'is_over_resolve_age',
+            Group.__dict__['is_over_resolve_age'],
+        )
+        Group.is_over_resolve_age = lambda self: True
 
         user = self.create_user()
         group = self.create_group(
@@ -133,37 +171,81 @@ class GroupSerializerTest(TestCase):
         user = self.create_user()
         group = self.create_group()
 
-        combinations = (
-            ((None, None), True),
-            ((UserOptionValue.all_conversations, None), True),
-            ((UserOptionValue.all_conversations, UserOptionValue.all_conversations), True),
-            ((UserOptionValue.all_conversations, UserOptionValue.participating_only), False),
-            ((UserOptionValue.participating_only, None), False),
-            ((UserOptionValue.participating_only, UserOptionValue.all_conversations), True),
-            ((UserOptionValue.participating_only, UserOptionValue.participating_only), False),
-        )
+        # Only the subscription state depends on the options being changed,
+        # so check it directly rather than serializing the whole group.
+        serializer = GroupSerializer()
 
-        def maybe_set_value(project, value):
-            if value is not None:
-                UserOption.objects.set_value(
-                    user=user,
-                    project=project,
-                    key='workflow:notifications',
-                    value=value,
-                )
-            else:
-                UserOption.objects.unset_value(
-                    user=user,
-                    project=project,
-                    key='workflow:notifications',
-                )
-
-        for options, expected_result in combinations:
-            UserOption.objects.clear_cache()
+        for options, expected_result in _IMPLICIT_SUBSCRIBED_CASES:
             default_value, project_value = options
-            maybe_set_value(None, default_value)
-            maybe_set_value(group.project, project_value)
-            assert serialize(group, user)['isSubscribed'] is expected_result, 'expected {!r} for {!r}'.format(expected_result, options)
+            UserOption.objects.apply_values(user, [
+                (None, 'workflow:notifications', default_value),
+                (group.project, 'workflow:notifications', project_value),
+            ])
+            is_subscribed, subscription = serializer._get_subscriptions([group], user)[group.id]
+            assert is_subscribed is expected_result, 'expected {!r} for {!r}'.format(expected_result, options)
+            assert subscription is None
+
+        # The options are left as set by the last case, which is unsubscribed.
+        result = serialize(group, user)
+        assert result['isSubscribed'] is _IMPLICIT_SUBSCRIBED_CASES[-1][1]
+        assert result['subscriptionDetails'] is None
+
+    def test_related_objects_are_fetched_in_bulk(self):
+        user = self.create_user()
+        # Use a separate project per group so that each group is attached to
+        # a distinct Project instance, whose organization is not yet cached.
+        groups = [
+            self.create_group(project=self.create_project())
+            for _ in range(3)
+        ]
+
+        self.assert_serialize_query_count_is_constant(groups, user)
+
+    def test_snoozes_are_fetched_in_bulk(self):
+        user = self.create_user()
+        now = _now_s()
+        groups = [
+            self.create_group(status=GroupStatus.IGNORED)
+            for _ in range(3)
+        ]
+        GroupSnooze.objects.bulk_create([
+            GroupSnooze(group=group, until=now + timedelta(minutes=1))
+            for group in groups
+        ])
+
+        self.assert_serialize_query_count_is_constant(groups, user)
+
+    def test_resolutions_are_fetched_in_bulk(self):
+        user = self.create_user()
+        release = Release.objects.create_with_project(
+            project=self.project,
+            version='a',
+        )
+        groups = [
+            self.create_group(status=GroupStatus.RESOLVED)
+            for _ in range(3)
+        ]
+        GroupResolution.objects.bulk_create([
+            GroupResolution(group=group, release=release)
+            for group in groups
+        ])
+
+        self.assert_serialize_query_count_is_constant(groups, user)
+
+    def test_subscriptions_are_fetched_in_bulk(self):
+        user = self.create_user()
+        groups = [self.create_group() for _ in range(3)]
+        GroupSubscription.objects.bulk_create([
+            GroupSubscription(
+                user=user,
+                group=group,
+                project=group.project,
+                is_active=True,
+            )
+            for group in groups
+        ])
+
+        self.assert_serialize_query_count_is_constant(groups, user)
 
     def test_no_user_unsubscribed(self):
         group = self.create_group()
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from sentry.models import Release, ReleaseProject
+from sentry.testutils import TestCase
+
+
+class ReleaseManagerTest(TestCase):
+    def test_create_with_project(self):
+        release = Release.objects.create_with_project(
+            project=self.project,
+            version='abcdef',
+        )
+
+        assert release.project == self.project
+        assert release.organization_id == self.project.organization_id
+        assert ReleaseProject.objects.filter(
+            project=self.project,
+            release=release,
+        ).exists()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from sentry.models import UserOption
+from sentry.testutils import TestCase
+
+
+class UserOptionManagerTest(TestCase):
+    def test_unset_value(self):
+        user = self.create_user()
+        UserOption.objects.set_value(user, self.project, 'foo', 'bar')
+        # populate the cache so it has to be kept in sync
+        assert UserOption.objects.get_value(user, self.project, 'foo') == 'bar'
+
+        UserOption.objects.unset_value(user, self.project, 'foo')
+
+        assert not UserOption.objects.filter(
+            user=user, project=self.project, key='foo').exists()
+        assert UserOption.objects.get_value(user, self.project, 'foo') is None
+
+    def test_apply_values(self):
+        user = self.create_user()
+        UserOption.objects.set_value(user, None, 'foo', 'bar')
+        UserOption.objects.set_value(user, self.project, 'foo', 'baz')
+        # populate the cache so it has to be kept in sync
+        assert UserOption.objects.get_value(user, None, 'foo') == 'bar'
+
+        UserOption.objects.apply_values(user, [
+            (None, 'foo', None),
+            (self.project, 'foo', 'qux'),
+        ])
+
+        assert not UserOption.objects.filter(
+            user=user, project__isnull=True, key='foo').exists()
+        assert UserOption.objects.get(
+            user=user, project=self.project, key='foo').value == 'qux'
+        assert UserOption.objects.get_value(user, None, 'foo') is None
+        assert UserOption.objects.get_value(user, self.project, 'foo') == 'qux'